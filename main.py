@@ -1,19 +1,69 @@
 import sqlite3
 import datetime
 import os
-from typing import Optional, Tuple
+import sys
+import csv
+import re
+import calendar
+import math
+import time
+from typing import Iterator, Optional, Tuple
 
 class FitnessTracker:
+    __slots__ = ("db_path", "conn", "_stats_cache", "_progress_cache", "_cache_day", "cur")
+    
+    _insert_sql = '''
+        INSERT OR REPLACE INTO fitness_log 
+        (date, weight, ran, distance, duration, notes)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    
+    _recent_sql = '''
+        SELECT date, weight, ran, distance, duration, notes
+        FROM fitness_log
+        ORDER BY date DESC
+        LIMIT ?
+    '''
+    
+    _progress_sql = '''
+        SELECT date, weight, weight - LAG(weight) OVER (ORDER BY date) as change
+        FROM fitness_log
+        WHERE date >= date('now', ? || ' days')
+        ORDER BY date ASC
+    '''
+    
+    _stats_sql = '''
+        SELECT 
+            COUNT(*) as total_days,
+            COALESCE(SUM(ran), 0) as run_days,
+            COALESCE(AVG(CASE WHEN ran = 1 THEN distance END), 0) as avg_distance,
+            COALESCE(SUM(CASE WHEN ran = 1 THEN distance END), 0) as total_distance,
+            COALESCE(AVG(CASE WHEN ran = 1 THEN duration END), 0) as avg_duration
+        FROM fitness_log
+        WHERE date >= date('now', ? || ' days')
+    '''
+    
     def __init__(self, db_path: str = "fitness_tracker.db"):
         self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, cached_statements=128)
+        self.conn.row_factory = sqlite3.Row
+        self.cur = self.conn.cursor()
+        self._stats_cache: dict = {}
+        self._progress_cache: dict = {}
+        self._cache_day = None
         self.init_database()
     
     def init_database(self):
         """Initialize the SQLite database and create tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.cur.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+        ''')
         
-        cursor.execute('''
+        self.cur.execute('''
             CREATE TABLE IF NOT EXISTS fitness_log (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date TEXT NOT NULL UNIQUE,
@@ -26,91 +76,104 @@ class FitnessTracker:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        self.cur.execute('''
+            CREATE INDEX IF NOT EXISTS idx_date_weight
+            ON fitness_log(date, weight)
+        ''')
+        
+        self.cur.execute('''
+            CREATE INDEX IF NOT EXISTS idx_date_run
+            ON fitness_log(date, ran, distance, duration)
+        ''')
+        
+        self.conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+    
+    def _invalidate_caches(self):
+        """Drop cached analytics after the log has been written to."""
+        self._stats_cache.clear()
+        self._progress_cache.clear()
+    
+    def _refresh_cache_day(self):
+        """Drop cached analytics once the UTC date used by date('now') changes."""
+        today = time.strftime('%Y-%m-%d', time.gmtime())
+        if today != self._cache_day:
+            self._invalidate_caches()
+            self._cache_day = today
     
     def add_entry(self, date: str, weight: float, ran: bool, distance: Optional[float] = None, 
                   duration: Optional[int] = None, notes: Optional[str] = None) -> bool:
         """Add a new fitness entry to the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO fitness_log 
-                (date, weight, ran, distance, duration, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (date, weight, ran, distance, duration, notes))
-            
-            conn.commit()
-            conn.close()
+            with self.conn:
+                self.cur.execute(self._insert_sql, (date, weight, ran, distance, duration, notes))
+            self._invalidate_caches()
             return True
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return False
     
+    def add_entries(self, rows: list) -> bool:
+        """Add many fitness entries in a single transaction."""
+        try:
+            with self.conn:
+                self.cur.executemany(self._insert_sql, rows)
+            self._invalidate_caches()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
+    
+    def iter_recent_entries(self, limit: int = 10) -> Iterator[sqlite3.Row]:
+        """Stream recent fitness entries without materializing the result set."""
+        # Uses its own cursor so other queries can run while this one is iterated.
+        yield from self.conn.execute(self._recent_sql, (limit,))
+    
     def get_recent_entries(self, limit: int = 10) -> list:
-        """Get recent fitness entries."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT date, weight, ran, distance, duration, notes
-            FROM fitness_log
-            ORDER BY date DESC
-            LIMIT ?
-        ''', (limit,))
-        
-        entries = cursor.fetchall()
-        conn.close()
-        return entries
+        """Get recent fitness entries as a list of sqlite3.Row objects."""
+        return list(self.iter_recent_entries(limit))
     
     def get_weight_progress(self, days: int = 30) -> list:
-        """Get weight progress for the last N days."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT date, weight
-            FROM fitness_log
-            WHERE date >= date('now', '-{} days')
-            ORDER BY date ASC
-        '''.format(days))
+        """Get weight progress and day-to-day change for the last N days."""
+        self._refresh_cache_day()
+        if days not in self._progress_cache:
+            self._progress_cache[days] = self.cur.execute(self._progress_sql, (-days,)).fetchall()
         
-        entries = cursor.fetchall()
-        conn.close()
-        return entries
+        return list(self._progress_cache[days])
     
     def get_running_stats(self, days: int = 30) -> dict:
         """Get running statistics for the last N days."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self._refresh_cache_day()
+        if days in self._stats_cache:
+            return dict(self._stats_cache[days])
         
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total_days,
-                SUM(CASE WHEN ran = 1 THEN 1 ELSE 0 END) as run_days,
-                AVG(CASE WHEN ran = 1 THEN distance END) as avg_distance,
-                SUM(CASE WHEN ran = 1 THEN distance END) as total_distance,
-                AVG(CASE WHEN ran = 1 THEN duration END) as avg_duration
-            FROM fitness_log
-            WHERE date >= date('now', '-{} days')
-        '''.format(days))
+        total_days, run_days, avg_distance, total_distance, avg_duration = \
+            self.cur.execute(self._stats_sql, (-days,)).fetchone()
         
-        result = cursor.fetchone()
-        conn.close()
-        
-        return {
-            'total_days': result[0] or 0,
-            'run_days': result[1] or 0,
-            'avg_distance': result[2] or 0,
-            'total_distance': result[3] or 0,
-            'avg_duration': result[4] or 0
+        stats = {
+            'total_days': total_days,
+            'run_days': run_days,
+            'avg_distance': avg_distance,
+            'total_distance': total_distance,
+            'avg_duration': avg_duration
         }
+        self._stats_cache[days] = stats
+        return dict(stats)
+
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_YES = frozenset(("y", "yes"))
+_NO = frozenset(("n", "no"))
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
 def get_float_input(prompt: str, min_val: float = 0) -> float:
     """Get validated float input from user."""
@@ -140,18 +203,82 @@ def get_yes_no_input(prompt: str) -> bool:
     """Get yes/no input from user."""
     while True:
         response = input(prompt + " (y/n): ").lower().strip()
-        if response in ['y', 'yes']:
+        if response in _YES:
             return True
-        elif response in ['n', 'no']:
+        elif response in _NO:
             return False
         else:
             print("Please enter 'y' or 'n'.")
 
-def format_duration(minutes: Optional[int]) -> str:
-    """Format duration in minutes to readable format."""
-    if minutes is None:
-        return "N/A"
+def is_valid_date(date_str: str) -> bool:
+    """Check that a string is a real calendar date in YYYY-MM-DD format."""
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return False
     
+    year, month, day = map(int, match.groups())
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
+
+_CSV_YES = _YES | {"1", "true"}
+_CSV_NO = _NO | {"0", "false"}
+_CSV_FIELDS = 6
+# Largest value SQLite can store in an INTEGER column.
+_MAX_SQLITE_INT = 2 ** 63 - 1
+
+def _parse_non_negative(value: str, cast=float):
+    """Parse a finite, non-negative number, raising ValueError otherwise."""
+    try:
+        number = cast(value)
+        if not math.isfinite(number) or number < 0 or number > _MAX_SQLITE_INT:
+            raise ValueError(value)
+    except OverflowError:
+        raise ValueError(value)
+    return number
+
+def read_csv_entries(path: str) -> list:
+    """Read fitness entries from a CSV file.
+    
+    Expected columns: date, weight, ran, distance, duration, notes.
+    A header row starting with 'date' is skipped. Values are validated
+    like the interactive prompts: numbers must be finite and >= 0, and
+    'ran' must be one of y/yes/n/no/1/0/true/false. Rows with more than
+    six fields (e.g. an unquoted comma in the notes) are rejected.
+    """
+    rows = []
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for line_no, record in enumerate(csv.reader(f), start=1):
+            if not record or (line_no == 1 and record[0].strip().lower() == 'date'):
+                continue
+            
+            record = [field.strip() for field in record]
+            
+            try:
+                if len(record) > _CSV_FIELDS:
+                    raise ValueError(record)
+                date_str, weight, ran, distance, duration, notes = \
+                    record + [''] * (_CSV_FIELDS - len(record))
+                
+                if not is_valid_date(date_str):
+                    raise ValueError(date_str)
+                ran = ran.lower()
+                if ran not in _CSV_YES and ran not in _CSV_NO:
+                    raise ValueError(ran)
+                ran = ran in _CSV_YES
+                rows.append((
+                    date_str,
+                    _parse_non_negative(weight),
+                    ran,
+                    _parse_non_negative(distance) if ran and distance else None,
+                    _parse_non_negative(duration, int) if ran and duration else None,
+                    notes or None,
+                ))
+            except ValueError:
+                raise ValueError(f"Invalid entry on line {line_no}: {','.join(record)}")
+    
+    return rows
+
+def _compute_duration(minutes: int) -> str:
+    """Format a duration in minutes without the lookup table."""
     hours = minutes // 60
     mins = minutes % 60
     
@@ -160,9 +287,37 @@ def format_duration(minutes: Optional[int]) -> str:
     else:
         return f"{mins}m"
 
-def main():
-    tracker = FitnessTracker()
+# Typical run durations, formatted once at import time.
+_DURATION_CACHE = {m: _compute_duration(m) for m in range(0, 301)}
+
+def format_duration(minutes: Optional[int]) -> str:
+    """Format duration in minutes to readable format."""
+    if minutes is None:
+        return "N/A"
+    
+    return _DURATION_CACHE.get(minutes) or _compute_duration(minutes)
+
+_ENTRY_HEADER = f"{'Date':<12} {'Weight':<8} {'Ran':<5} {'Distance':<10} {'Duration':<10} {'Notes'}"
+_RAN_STRS = ("No", "Yes")
+
+def format_entry(entry: sqlite3.Row) -> str:
+    """Format a fitness entry as a single table row."""
+    date, weight, ran, distance, duration, notes = entry
+    distance_str = f"{distance:.1f}" if distance else "N/A"
+    notes_str = notes[:15] + "..." if notes and len(notes) > 15 else notes or ""
+    
+    return f"{date:<12} {weight:<8.1f} {_RAN_STRS[bool(ran)]:<5} {distance_str:<10} {format_duration(duration):<10} {notes_str}"
+
+_PROGRESS_HEADER = f"{'Date':<12} {'Weight':<8} {'Change'}"
+
+def format_progress(row: sqlite3.Row) -> str:
+    """Format a weight progress row as a single table row."""
+    date, weight, change = row
+    change_str = f"{change:+.1f}" if change is not None else "N/A"
     
+    return f"{date:<12} {weight:<8.1f} {change_str}"
+
+def run_menu(tracker: FitnessTracker):
     while True:
         clear_screen()
         print("FITNESS TRACKER")
@@ -172,10 +327,11 @@ def main():
         print("3. View weight progress")
         print("4. View running statistics")
         print("5. Add entry for specific date")
-        print("6. Exit")
+        print("6. Import entries from CSV")
+        print("7. Exit")
         print("=" * 40)
         
-        choice = input("Select an option (1-6): ").strip()
+        choice = input("Select an option (1-7): ").strip()
         
         if choice == '1':
             # Add today's entry
@@ -212,22 +368,14 @@ def main():
             print("RECENT ENTRIES")
             print("-" * 50)
             
-            entries = tracker.get_recent_entries()
+            rows = [format_entry(entry) for entry in tracker.iter_recent_entries()]
             
-            if not entries:
+            if not rows:
                 print("No entries found.")
             else:
-                print(f"{'Date':<12} {'Weight':<8} {'Ran':<5} {'Distance':<10} {'Duration':<10} {'Notes'}")
-                print("-" * 65)
-                
-                for entry in entries:
-                    date, weight, ran, distance, duration, notes = entry
-                    ran_str = "Yes" if ran else "No"
-                    distance_str = f"{distance:.1f}" if distance else "N/A"
-                    duration_str = format_duration(duration)
-                    notes_str = notes[:15] + "..." if notes and len(notes) > 15 else notes or ""
-                    
-                    print(f"{date:<12} {weight:<8.1f} {ran_str:<5} {distance_str:<10} {duration_str:<10} {notes_str}")
+                lines = [_ENTRY_HEADER, "-" * 65]
+                lines.extend(rows)
+                sys.stdout.write("\n".join(lines) + "\n")
             
             input("\nPress Enter to continue...")
         
@@ -242,19 +390,9 @@ def main():
             if not progress:
                 print("No weight data found.")
             else:
-                print(f"{'Date':<12} {'Weight':<8} {'Change'}")
-                print("-" * 28)
-                
-                prev_weight = None
-                for i, (date, weight) in enumerate(progress):
-                    if prev_weight is not None:
-                        change = weight - prev_weight
-                        change_str = f"{change:+.1f}"
-                    else:
-                        change_str = "N/A"
-                    
-                    print(f"{date:<12} {weight:<8.1f} {change_str}")
-                    prev_weight = weight
+                lines = [_PROGRESS_HEADER, "-" * 28]
+                lines.extend(format_progress(row) for row in progress)
+                sys.stdout.write("\n".join(lines) + "\n")
                 
                 if len(progress) >= 2:
                     total_change = progress[-1][1] - progress[0][1]
@@ -292,11 +430,9 @@ def main():
             
             while True:
                 date_str = input("Enter date (YYYY-MM-DD): ").strip()
-                try:
-                    datetime.datetime.strptime(date_str, '%Y-%m-%d')
+                if is_valid_date(date_str):
                     break
-                except ValueError:
-                    print("Invalid date format. Please use YYYY-MM-DD.")
+                print("Invalid date format. Please use YYYY-MM-DD.")
             
             weight = get_float_input("Enter weight (lbs/kg): ")
             
@@ -319,6 +455,34 @@ def main():
             input("\nPress Enter to continue...")
         
         elif choice == '6':
+            # Import entries from CSV
+            clear_screen()
+            print("IMPORT ENTRIES FROM CSV")
+            print("-" * 30)
+            print("Columns: date, weight, ran, distance, duration, notes")
+            
+            path = input("CSV file path: ").strip()
+            
+            try:
+                rows = read_csv_entries(path)
+            except OSError as e:
+                print(f"\nCould not read file: {e}")
+                rows = None
+            except ValueError as e:
+                print(f"\n{e}")
+                rows = None
+            
+            if rows is not None:
+                if not rows:
+                    print("\nNo entries found in file.")
+                elif tracker.add_entries(rows):
+                    print(f"\n{len(rows)} entries imported successfully!")
+                else:
+                    print("\nFailed to import entries.")
+            
+            input("\nPress Enter to continue...")
+        
+        elif choice == '7':
             print("\nThanks for using Fitness Tracker!")
             break
         
@@ -326,5 +490,13 @@ def main():
             print("\nInvalid option. Please try again.")
             input("Press Enter to continue...")
 
+def main():
+    tracker = FitnessTracker()
+    
+    try:
+        run_menu(tracker)
+    finally:
+        tracker.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file